@@ -2,33 +2,74 @@
  Best Fit, Worst Fit, Next Fit Implementations
 """
 
+import bisect
+import gc
 import random
 import time
 
 
-# ==================== CORE DATA STRUCTURES ====================
-class FreeBlock:
-    """Represents a free memory block in the linked list"""
+# ==================== SEARCH KERNELS ====================
+# Each kernel works only on the list of free block sizes and returns the
+# index of the chosen block, or -1 if no block is large enough.
+
+def _best_fit_index(sizes, size):
+    """Index of the smallest block that fits (first one on ties)"""
+    # filter/min/index all run in C, so this is a single pass without
+    # Python bytecode; an exact fit, if any, is the minimum it finds
+    best_size = min(filter(size.__le__, sizes), default=None)
+    if best_size is None:
+        return -1
+    return sizes.index(best_size)
 
-    def __init__(self, start, size):
-        self.start = start  # Starting address of the free block
-        self.size = size  # Size of the free block
-        self.next = None  # Pointer to next free block
 
+def _worst_fit_index(sizes, size):
+    """Index of the largest block if it fits (first one on ties)"""
+    worst_size = max(sizes, default=None)
+    if worst_size is None or worst_size < size:
+        return -1
+    return sizes.index(worst_size)
 
+
+def _next_fit_index(sizes, size, cursor):
+    """Index of the first fitting block at or after cursor, wrapping around"""
+    n = len(sizes)
+    if cursor >= n:
+        cursor = 0  # Cursor ran off the end: start from the beginning
+    for k in range(n):
+        i = cursor + k
+        if i >= n:
+            i -= n
+        if sizes[i] >= size:
+            return i
+    return -1
+
+
+# ==================== DISPLAY HELPERS ====================
+def _print_free_blocks(algorithm, blocks):
+    """Print (start, size) free blocks as one line with a single print call"""
+    entries = " → ".join(f"[{start:3d}-{start + size - 1:3d}]({size:3d})"
+                         for start, size in blocks)
+    print(f"{algorithm:10s} Free List: {entries}")
+
+
+# ==================== CORE DATA STRUCTURES ====================
 class MemoryAllocator:
     """Main memory allocator implementing all three algorithms"""
 
     def __init__(self, total_memory=100):
         """Initialize allocator with total memory size"""
         self.total_memory = total_memory
+        # Free list stored as two parallel lists kept sorted by start address:
+        # free block i covers [starts[i], starts[i] + sizes[i])
         # Initially one big free block covering entire memory
-        self.free_list = FreeBlock(0, total_memory)
-        # Track allocated blocks for freeing (block_id -> (start, size))
-        self.allocated_blocks = {}
-        # Roving pointer for Next Fit algorithm
-        self.next_fit_ptr = self.free_list
-        # Counter for generating unique block IDs
+        self.starts = [0]
+        self.sizes = [total_memory]
+        # Track allocated blocks for freeing: IDs are handed out in order, so
+        # allocated_blocks[block_id] is (start, size), or None once freed
+        self.allocated_blocks = []
+        # Roving cursor (index into the free list) for Next Fit algorithm
+        self.next_fit_idx = 0
+        # ID given to the next successful allocation
         self.block_id_counter = 0
         # For tracking allocation sequence for experiments
         self.allocation_sequence = []
@@ -37,37 +78,44 @@ class MemoryAllocator:
 
     def print_free_list(self, algorithm=""):
         """Print the current free list in readable format"""
-        print(f"{algorithm:10s} Free List: ", end="")
-        current = self.free_list
-        while current:
-            print(f"[{current.start:3d}-{current.start + current.size - 1:3d}]({current.size:3d})", end="")
-            if current.next:
-                print(" → ", end="")
-            current = current.next
-        print()
-
-    def coalesce_free_blocks(self):
-        """Merge adjacent free blocks in the free list"""
-        if not self.free_list:
-            return
-
-        current = self.free_list
-        while current and current.next:
-            # If current block ends where next block starts, merge them
-            if current.start + current.size == current.next.start:
-                current.size += current.next.size
-                current.next = current.next.next
-            else:
-                current = current.next
+        _print_free_blocks(algorithm, zip(self.starts, self.sizes))
 
     def reset(self):
         """Reset allocator to initial state"""
-        self.free_list = FreeBlock(0, self.total_memory)
-        self.allocated_blocks = {}
-        self.next_fit_ptr = self.free_list
+        self.starts = [0]
+        self.sizes = [self.total_memory]
+        self.allocated_blocks = []
+        self.next_fit_idx = 0
         self.block_id_counter = 0
         self.allocation_sequence = []
 
+    def _take_from(self, idx, size):
+        """Allocate size units from the front of free block idx"""
+        if self.sizes[idx] == size:  # Exact fit - remove entire block
+            del self.starts[idx]
+            del self.sizes[idx]
+            # If the cursor was on the removed block it moves on to the
+            # following block
+            self._move_cursor(idx, shift=-1)
+        else:  # Split the block - allocate from beginning
+            self.starts[idx] += size
+            self.sizes[idx] -= size
+
+    def _move_cursor(self, idx, absorbed=False, shift=0):
+        """
+        Keep the Next Fit cursor on the same block after the free list changed
+        at idx: absorbed means block idx was merged into a freed block (the
+        cursor then resets to the beginning), shift is -1 if an entry was
+        removed at idx and +1 if one was inserted there
+        """
+        cursor = self.next_fit_idx
+        if absorbed and cursor == idx:
+            self.next_fit_idx = 0
+        elif shift < 0 and cursor > idx:
+            self.next_fit_idx = cursor - 1
+        elif shift > 0 and idx <= cursor < len(self.starts) - 1:
+            self.next_fit_idx = cursor + 1
+
     # ==================== ALLOCATION ALGORITHMS ====================
 
     def allocate_best_fit(self, size, block_id=None):
@@ -77,44 +125,21 @@ class MemoryAllocator:
         """
         if block_id is None:
             block_id = self.block_id_counter
-            self.block_id_counter += 1
-
-        if not self.free_list:
-            return None  # No free memory
-
-        best_block = None
-        best_prev = None
-        current = self.free_list
-        prev = None
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
 
         # Search entire list for the best (smallest) fit
-        while current:
-            if current.size >= size:
-                # Check if this is better than current best
-                if best_block is None or current.size < best_block.size:
-                    best_block = current
-                    best_prev = prev
-            prev = current
-            current = current.next
-
-        if not best_block:
+        best_idx = _best_fit_index(self.sizes, size)
+        if best_idx < 0:
             return None  # No block large enough
 
         # Allocate from the best block
-        allocated_start = best_block.start
-
-        # Update the free list
-        if best_block.size == size:  # Exact fit - remove entire block
-            if best_prev:
-                best_prev.next = best_block.next
-            else:
-                self.free_list = best_block.next
-        else:  # Split the block - allocate from beginning
-            best_block.start += size
-            best_block.size -= size
+        allocated_start = self.starts[best_idx]
+        self._take_from(best_idx, size)
 
         # Record the allocation
-        self.allocated_blocks[block_id] = (allocated_start, size)
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
         self.allocation_sequence.append(('allocate', block_id, size, 'best_fit'))
 
         return allocated_start
@@ -126,42 +151,20 @@ class MemoryAllocator:
         """
         if block_id is None:
             block_id = self.block_id_counter
-            self.block_id_counter += 1
-
-        if not self.free_list:
-            return None
-
-        worst_block = None
-        worst_prev = None
-        current = self.free_list
-        prev = None
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
 
         # Search entire list for the worst (largest) fit
-        while current:
-            if current.size >= size:
-                if worst_block is None or current.size > worst_block.size:
-                    worst_block = current
-                    worst_prev = prev
-            prev = current
-            current = current.next
-
-        if not worst_block:
+        worst_idx = _worst_fit_index(self.sizes, size)
+        if worst_idx < 0:
             return None
 
         # Allocate from the worst (largest) block
-        allocated_start = worst_block.start
-
-        # Update the free list
-        if worst_block.size == size:  # Exact fit
-            if worst_prev:
-                worst_prev.next = worst_block.next
-            else:
-                self.free_list = worst_block.next
-        else:  # Split the block
-            worst_block.start += size
-            worst_block.size -= size
+        allocated_start = self.starts[worst_idx]
+        self._take_from(worst_idx, size)
 
-        self.allocated_blocks[block_id] = (allocated_start, size)
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
         self.allocation_sequence.append(('allocate', block_id, size, 'worst_fit'))
 
         return allocated_start
@@ -169,120 +172,491 @@ class MemoryAllocator:
     def allocate_next_fit(self, size, block_id=None):
         """
         NEXT FIT: Start search from last allocation position
-        Uses roving pointer to distribute allocations across memory
+        Uses roving cursor to distribute allocations across memory
         """
         if block_id is None:
             block_id = self.block_id_counter
-            self.block_id_counter += 1
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
+
+        # Scan from the roving cursor to the end, then wrap around to it
+        i = _next_fit_index(self.sizes, size, self.next_fit_idx)
+        if i < 0:
+            return None  # No block found
+
+        allocated_start = self.starts[i]
+        self._take_from(i, size)
+        # Cursor now sits on the remainder, or on the block after an
+        # exact fit (wrapping to the beginning past the end)
+        self.next_fit_idx = i if i < len(self.sizes) else 0
+
+        # Record allocation
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
+        self.allocation_sequence.append(('allocate', block_id, size, 'next_fit'))
+        return allocated_start
 
-        if not self.free_list:
-            return None
+    def free_block(self, block_id):
+        """Free an allocated block and merge with adjacent free blocks"""
+        if not 0 <= block_id < len(self.allocated_blocks):
+            return False
+        entry = self.allocated_blocks[block_id]
+        if entry is None:
+            return False  # Already freed
+        self.allocated_blocks[block_id] = None
+        start, size = entry
+
+        starts, sizes = self.starts, self.sizes
+        # Binary search for the insertion point (list is sorted by start)
+        idx = bisect.bisect_left(starts, start)
+
+        # Insert and coalesce in one step: only the immediate neighbours can
+        # be adjacent to the freed block
+        if idx > 0 and starts[idx - 1] + sizes[idx - 1] == start:
+            if idx < len(starts) and start + size == starts[idx]:
+                # Freed block bridges the gap: absorb it and the next block into prev
+                sizes[idx - 1] += size + sizes[idx]
+                del starts[idx]
+                del sizes[idx]
+                self._move_cursor(idx, absorbed=True, shift=-1)
+            else:
+                sizes[idx - 1] += size
+        elif idx < len(starts) and start + size == starts[idx]:
+            starts[idx] = start
+            sizes[idx] += size
+            self._move_cursor(idx, absorbed=True)
+        else:
+            starts.insert(idx, start)
+            sizes.insert(idx, size)
+            self._move_cursor(idx, shift=1)
+
+        self.allocation_sequence.append(('free', block_id, size, None))
+        return True
+
+
+# ==================== SEGREGATED FIT ALLOCATOR ====================
+class FreeBlock:
+    """Represents a free memory block in a size-class list"""
+
+    # No per-instance __dict__: smaller nodes and faster attribute access
+    __slots__ = ('start', 'size', 'next', 'prev')
+
+    def __init__(self, start, size):
+        self.start = start  # Starting address of the free block
+        self.size = size  # Size of the free block
+        self.next = None  # Pointer to next free block in the same size class
+        self.prev = None  # Pointer to previous free block in the same size class
+
+
+class SegregatedFitAllocator:
+    """
+    Segregated free lists: one linked list per power-of-two size class.
+    Bucket k holds blocks whose size has bit_length() == k, so a request
+    only looks at buckets that can satisfy it instead of the whole list
+    """
+
+    NUM_CLASSES = 32
+
+    def __init__(self, total_memory=100):
+        """Initialize allocator with total memory size"""
+        self.total_memory = total_memory
+        self.reset()
+
+    # ==================== UTILITY METHODS ====================
+
+    def print_free_list(self, algorithm=""):
+        """Print the current free blocks in address order"""
+        _print_free_blocks(algorithm, sorted((start, block.size)
+                                             for start, block in self.free_by_start.items()))
+
+    def reset(self):
+        """Reset allocator to initial state"""
+        # Head of the free list for each size class
+        self.buckets = [None] * self.NUM_CLASSES
+        # Free blocks indexed by start and end address for O(1) coalescing
+        self.free_by_start = {}
+        self.free_by_end = {}
+        # Retired FreeBlock nodes, recycled instead of allocating new ones
+        self._fb_pool = []
+        self.allocated_blocks = []
+        self.block_id_counter = 0
+        self.allocation_sequence = []
+        # Initially one big free block covering entire memory
+        self._insert_free(0, self.total_memory)
+
+    def _size_class(self, size):
+        """Bucket index for a block of the given size"""
+        return min(size.bit_length(), self.NUM_CLASSES - 1)
+
+    def _insert_free(self, start, size):
+        """Push a free block onto the head of its size class"""
+        if self._fb_pool:
+            block = self._fb_pool.pop()
+            block.start = start
+            block.size = size
+        else:
+            block = FreeBlock(start, size)
+        cls = self._size_class(size)
+        head = self.buckets[cls]
+        block.prev = None
+        block.next = head
+        if head:
+            head.prev = block
+        self.buckets[cls] = block
+        self.free_by_start[start] = block
+        self.free_by_end[start + size] = block
+
+    def _remove_free(self, block):
+        """Unlink a free block from its size class and retire the node"""
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.buckets[self._size_class(block.size)] = block.next
+        if block.next:
+            block.next.prev = block.prev
+        del self.free_by_start[block.start]
+        del self.free_by_end[block.start + block.size]
+        self._fb_pool.append(block)
+
+    def _take_from(self, block, size):
+        """Allocate size units from the front of block, re-bucketing the rest"""
+        remainder = block.size - size
+        self._remove_free(block)
+        if remainder > 0:
+            self._insert_free(block.start + size, remainder)
+
+    # ==================== ALLOCATION ALGORITHMS ====================
 
-        # Start from roving pointer or beginning if None
-        start_node = self.next_fit_ptr if self.next_fit_ptr else self.free_list
-        current = start_node
-        first_pass = True
-
-        while current:
-            if current.size >= size:
-                # Found a fitting block
-                allocated_start = current.start
-                
-                # Update free list
-                if current.size == size:  # Exact fit
-                    # Remove current node from free list
-                    # Find previous node
-                    prev = None
-                    temp = self.free_list
-                    while temp and temp != current:
-                        prev = temp
-                        temp = temp.next
-                    
-                    if prev:
-                        prev.next = current.next
-                    else:
-                        self.free_list = current.next
-                    
-                    # Update next_fit_ptr to next node or beginning
-                    self.next_fit_ptr = current.next if current.next else self.free_list
-                else:  # Split the block
-                    current.start += size
-                    current.size -= size
-                    # Update roving pointer to current block (the remainder)
-                    self.next_fit_ptr = current
-                
-                # Record allocation
-                self.allocated_blocks[block_id] = (allocated_start, size)
-                self.allocation_sequence.append(('allocate', block_id, size, 'next_fit'))
-                return allocated_start
-            
-            # Move to next block
-            current = current.next
-            
-            # If we've reached the end, wrap around to beginning
-            if not current and first_pass:
-                current = self.free_list
-                first_pass = False
-            
-            # If we've come back to start_node, break to avoid infinite loop
-            if current == start_node and not first_pass:
+    def allocate_best_fit(self, size, block_id=None):
+        """
+        SEGREGATED BEST FIT: Take the first fitting block from the smallest
+        size class that can hold the request
+        """
+        if block_id is None:
+            block_id = self.block_id_counter
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
+
+        # Only the request's own class can hold blocks that are too small;
+        # the head of any larger non-empty class always fits
+        for cls in range(self._size_class(size), self.NUM_CLASSES):
+            block = self.buckets[cls]
+            while block and block.size < size:
+                block = block.next
+            if block:
+                break
+        else:
+            return None  # No block large enough
+
+        allocated_start = block.start
+        self._take_from(block, size)
+
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
+        self.allocation_sequence.append(('allocate', block_id, size, 'segregated_best_fit'))
+
+        return allocated_start
+
+    def allocate_worst_fit(self, size, block_id=None):
+        """
+        SEGREGATED WORST FIT: Take the largest block of the highest
+        non-empty size class
+        """
+        if block_id is None:
+            block_id = self.block_id_counter
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
+
+        block = None
+        for cls in range(self.NUM_CLASSES - 1, -1, -1):
+            current = self.buckets[cls]
+            while current:
+                if block is None or current.size > block.size:
+                    block = current
+                current = current.next
+            if block:
                 break
 
-        return None  # No block found
+        if block is None or block.size < size:
+            return None
+
+        allocated_start = block.start
+        self._take_from(block, size)
+
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
+        self.allocation_sequence.append(('allocate', block_id, size, 'segregated_worst_fit'))
+
+        return allocated_start
 
     def free_block(self, block_id):
         """Free an allocated block and merge with adjacent free blocks"""
-        if block_id not in self.allocated_blocks:
+        if not 0 <= block_id < len(self.allocated_blocks):
             return False
+        entry = self.allocated_blocks[block_id]
+        if entry is None:
+            return False  # Already freed
+        self.allocated_blocks[block_id] = None
+        start, size = entry
+        freed_size = size
+
+        # Merge with the free block ending where this one starts
+        left = self.free_by_end.get(start)
+        if left:
+            start = left.start
+            size += left.size
+            self._remove_free(left)
+
+        # Merge with the free block starting where this one ends
+        right = self.free_by_start.get(start + size)
+        if right:
+            size += right.size
+            self._remove_free(right)
+
+        self._insert_free(start, size)
+
+        self.allocation_sequence.append(('free', block_id, freed_size, None))
+        return True
 
-        start, size = self.allocated_blocks[block_id]
-        del self.allocated_blocks[block_id]
 
-        # Create new free block
-        new_block = FreeBlock(start, size)
+# ==================== BUDDY ALLOCATOR ====================
+class BuddyAllocator:
+    """
+    Buddy system: blocks are power-of-two sized and aligned, kept in one
+    free list per order. A block's buddy is found by flipping its order bit
+    """
 
-        # Insert into free list in sorted position (by start address)
-        if not self.free_list or start < self.free_list.start:
-            # Insert at beginning
-            new_block.next = self.free_list
-            self.free_list = new_block
-        else:
-            # Find insertion point
-            current = self.free_list
-            prev = None
-            while current and current.start < start:
-                prev = current
-                current = current.next
+    def __init__(self, total_memory=100):
+        """Initialize allocator with total memory size"""
+        self.total_memory = total_memory
+        # Largest order whose block still fits in memory
+        self.max_order = total_memory.bit_length() - 1
+        self.reset()
+
+    # ==================== UTILITY METHODS ====================
+
+    @property
+    def sizes(self):
+        """Sizes of all free blocks, in address order"""
+        return [size for _, size in self._free_blocks()]
+
+    @property
+    def rounding_waste(self):
+        """Units lost inside allocated blocks to rounding sizes up to a power of two"""
+        return sum((1 << self._order_for(size)) - size
+                   for _, size in filter(None, self.allocated_blocks))
+
+    def _free_blocks(self):
+        """All free blocks as (start, size), sorted by start address"""
+        return sorted((start, 1 << order)
+                      for order, starts in enumerate(self.free_lists)
+                      for start in starts)
+
+    def print_free_list(self, algorithm=""):
+        """Print the current free blocks in address order"""
+        _print_free_blocks(algorithm, self._free_blocks())
+
+    def reset(self):
+        """Reset allocator to initial state"""
+        # free_lists[order] holds start addresses of free blocks of size
+        # 2**order, kept sorted so buddies are found by binary search
+        self.free_lists = [[] for _ in range(self.max_order + 1)]
+        self.allocated_blocks = []
+        self.block_id_counter = 0
+        self.allocation_sequence = []
+
+        # Carve memory into aligned power-of-two blocks, largest first
+        # (e.g. 100 units -> 64 + 32 + 4)
+        start = 0
+        for order in range(self.max_order, -1, -1):
+            if self.total_memory - start >= 1 << order:
+                self.free_lists[order].append(start)
+                start += 1 << order
+
+    @staticmethod
+    def _order_for(size):
+        """Smallest order whose block size is at least size"""
+        return (size - 1).bit_length() if size > 1 else 0
+
+    # ==================== ALLOCATION ALGORITHM ====================
 
-            # Insert between prev and current
-            new_block.next = current
-            if prev:
-                prev.next = new_block
-
-        # Coalesce adjacent blocks
-        self.coalesce_free_blocks()
-
-        # Update next_fit_ptr if it points to a block that was freed
-        # If next_fit_ptr is None or points to a block that's no longer in free list,
-        # reset it to free_list
-        if self.next_fit_ptr:
-            # Check if next_fit_ptr is still in the free list
-            temp = self.free_list
-            found = False
-            while temp:
-                if temp == self.next_fit_ptr:
-                    found = True
-                    break
-                temp = temp.next
-            if not found:
-                self.next_fit_ptr = self.free_list
+    def allocate(self, size, block_id=None):
+        """
+        BUDDY: Round the request up to a power of two and split larger
+        blocks in half until a block of that order is free
+        """
+        if block_id is None:
+            block_id = self.block_id_counter
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
+
+        order = self._order_for(size)
+
+        # Find the smallest non-empty order that can hold the request
+        for k in range(order, len(self.free_lists)):
+            if self.free_lists[k]:
+                break
         else:
-            self.next_fit_ptr = self.free_list
+            return None  # No block large enough
+
+        # Take the lowest-addressed block of that order
+        allocated_start = self.free_lists[k].pop(0)
+
+        # Split down to the requested order, freeing the upper halves
+        while k > order:
+            k -= 1
+            bisect.insort(self.free_lists[k], allocated_start + (1 << k))
+
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
+        self.allocation_sequence.append(('allocate', block_id, size, 'buddy'))
+
+        return allocated_start
+
+    def free_block(self, block_id):
+        """Free an allocated block and merge it with its free buddies"""
+        if not 0 <= block_id < len(self.allocated_blocks):
+            return False
+        entry = self.allocated_blocks[block_id]
+        if entry is None:
+            return False  # Already freed
+        self.allocated_blocks[block_id] = None
+        start, size = entry
+
+        order = self._order_for(size)
+        while order < self.max_order:
+            buddy = start ^ (1 << order)
+            free_list = self.free_lists[order]
+            idx = bisect.bisect_left(free_list, buddy)
+            if idx == len(free_list) or free_list[idx] != buddy:
+                break
+            # Buddy is free: merge into the block of the next order up
+            del free_list[idx]
+            start = min(start, buddy)
+            order += 1
+        bisect.insort(self.free_lists[order], start)
 
         self.allocation_sequence.append(('free', block_id, size, None))
         return True
 
 
+# ==================== BITMAP ALLOCATOR ====================
+class BitmapAllocator:
+    """
+    Bitmap allocator: one bit per memory unit (1 = allocated), held in a
+    single Python int so runs of free units are found with whole-word
+    shifts and masks. Coalescing is implicit: freeing just clears bits
+    """
+
+    def __init__(self, total_memory=100):
+        """Initialize allocator with total memory size"""
+        self.total_memory = total_memory
+        # Mask with one bit set for every unit of memory
+        self.full_mask = (1 << total_memory) - 1
+        self.reset()
+
+    # ==================== UTILITY METHODS ====================
+
+    @property
+    def sizes(self):
+        """Sizes of all free blocks, in address order"""
+        return [size for _, size in self._free_blocks()]
+
+    def _free_blocks(self):
+        """All maximal runs of free units as (start, size), by start address"""
+        blocks = []
+        free = ~self.bits & self.full_mask
+        while free:
+            start = (free & -free).bit_length() - 1
+            run = free >> start
+            # ~run & (run + 1) isolates the first allocated bit above the run
+            size = (~run & (run + 1)).bit_length() - 1
+            blocks.append((start, size))
+            free &= ~(((1 << size) - 1) << start)
+        return blocks
+
+    def print_free_list(self, algorithm=""):
+        """Print the current free blocks in address order"""
+        _print_free_blocks(algorithm, self._free_blocks())
+
+    def reset(self):
+        """Reset allocator to initial state"""
+        self.bits = 0  # All memory free
+        self.allocated_blocks = []
+        self.block_id_counter = 0
+        self.allocation_sequence = []
+
+    # ==================== ALLOCATION ALGORITHM ====================
+
+    def allocate(self, size, block_id=None):
+        """
+        BITMAP FIRST FIT: Allocate the lowest run of size free units
+        """
+        if block_id is None:
+            block_id = self.block_id_counter
+        elif block_id != self.block_id_counter:
+            raise ValueError(f"block_id must be the next ID ({self.block_id_counter})")
+
+        # After this loop bit i of fits is set iff units i .. i+size-1 are all
+        # free; the covered run length doubles each step, so it takes
+        # O(log size) shifts of the whole bitmap
+        fits = ~self.bits & self.full_mask
+        run = 1
+        while run < size and fits:
+            step = min(run, size - run)
+            fits &= fits >> step
+            run += step
+
+        if not fits:
+            return None  # No run of free units large enough
+
+        allocated_start = (fits & -fits).bit_length() - 1
+        self.bits |= ((1 << size) - 1) << allocated_start
+
+        self.allocated_blocks.append((allocated_start, size))
+        self.block_id_counter += 1
+        self.allocation_sequence.append(('allocate', block_id, size, 'bitmap'))
+
+        return allocated_start
+
+    def free_block(self, block_id):
+        """Free an allocated block by clearing its bits"""
+        if not 0 <= block_id < len(self.allocated_blocks):
+            return False
+        entry = self.allocated_blocks[block_id]
+        if entry is None:
+            return False  # Already freed
+        self.allocated_blocks[block_id] = None
+        start, size = entry
+
+        self.bits &= ~(((1 << size) - 1) << start)
+
+        self.allocation_sequence.append(('free', block_id, size, None))
+        return True
+
+
+# ==================== EXPERIMENT SETUP ====================
+# Allocator class and allocate method used for each algorithm name
+ALLOCATORS = {
+    'Best Fit': (MemoryAllocator, 'allocate_best_fit'),
+    'Worst Fit': (MemoryAllocator, 'allocate_worst_fit'),
+    'Next Fit': (MemoryAllocator, 'allocate_next_fit'),
+    'Segregated Fit': (SegregatedFitAllocator, 'allocate_best_fit'),
+    'Buddy': (BuddyAllocator, 'allocate'),
+    'Bitmap': (BitmapAllocator, 'allocate')
+}
+
+
+def create_allocator(algo_name, total_memory=100):
+    """
+    Create the allocator used for algo_name and return it together with its
+    bound allocate method, so experiment loops call it without re-dispatching
+    """
+    allocator_class, method_name = ALLOCATORS[algo_name]
+    allocator = allocator_class(total_memory)
+    return allocator, getattr(allocator, method_name)
+
+
 # ==================== EXPERIMENT 1: ALLOCATION TRACE ====================
 def experiment1_allocation_trace():
     """Run Experiment 1: Fixed allocation/free sequence"""
@@ -296,9 +670,8 @@ def experiment1_allocation_trace():
 
     # Create three allocators, one for each algorithm
     allocators = {
-        'Best Fit': MemoryAllocator(100),
-        'Worst Fit': MemoryAllocator(100),
-        'Next Fit': MemoryAllocator(100)
+        algo_name: create_allocator(algo_name, 100)
+        for algo_name in ['Best Fit', 'Worst Fit', 'Next Fit']
     }
 
     # Track allocations for each algorithm
@@ -313,23 +686,19 @@ def experiment1_allocation_trace():
         print(f"Step {step + 1}: Request {request}")
         print('=' * 50)
 
-        for algo_name, allocator in allocators.items():
+        for algo_name, (allocator, allocate) in allocators.items():
             if request > 0:  # Allocation
                 # Generate block ID
                 block_id = allocator.block_id_counter
 
+                # Perform allocation with this algorithm
+                result = allocate(request, block_id)
+
                 # Store mapping for later freeing
-                if request not in allocations_by_size[algo_name]:
-                    allocations_by_size[algo_name][request] = []
-                allocations_by_size[algo_name][request].append(block_id)
-
-                # Perform allocation based on algorithm
-                if algo_name == 'Best Fit':
-                    result = allocator.allocate_best_fit(request, block_id)
-                elif algo_name == 'Worst Fit':
-                    result = allocator.allocate_worst_fit(request, block_id)
-                else:  # Next Fit
-                    result = allocator.allocate_next_fit(request, block_id)
+                if result is not None:
+                    if request not in allocations_by_size[algo_name]:
+                        allocations_by_size[algo_name][request] = []
+                    allocations_by_size[algo_name][request].append(block_id)
 
                 allocator.print_free_list(algo_name)
 
@@ -388,8 +757,10 @@ def experiment2_fragmentation_test():
 
     # Set random seed for reproducible results
     random.seed(42)
+    # Every algorithm gets the same allocation sizes
+    alloc_sizes = [random.randint(3, 12) for _ in range(12)]
 
-    algorithms = ['Best Fit', 'Worst Fit', 'Next Fit']
+    algorithms = ['Best Fit', 'Worst Fit', 'Next Fit', 'Buddy']
     results = {}
 
     for algo_name in algorithms:
@@ -398,22 +769,16 @@ def experiment2_fragmentation_test():
         print('=' * 50)
 
         # Create allocator
-        allocator = MemoryAllocator(100)
+        allocator, allocate = create_allocator(algo_name, 100)
 
         # Step 1: 12 random allocations
         print("\n1. Making 12 random allocations (size 3-12):")
         allocated_blocks = []  # List of (block_id, size)
 
-        for i in range(12):
-            size = random.randint(3, 12)
+        for size in alloc_sizes:
             block_id = allocator.block_id_counter
 
-            if algo_name == 'Best Fit':
-                result = allocator.allocate_best_fit(size, block_id)
-            elif algo_name == 'Worst Fit':
-                result = allocator.allocate_worst_fit(size, block_id)
-            else:  # Next Fit
-                result = allocator.allocate_next_fit(size, block_id)
+            result = allocate(size, block_id)
 
             if result is not None:
                 allocated_blocks.append((block_id, size))
@@ -437,25 +802,12 @@ def experiment2_fragmentation_test():
 
         # Step 3: Attempt to allocate 25 units
         print("\n3. Attempting to allocate size 25:")
-        if algo_name == 'Best Fit':
-            result = allocator.allocate_best_fit(25)
-        elif algo_name == 'Worst Fit':
-            result = allocator.allocate_worst_fit(25)
-        else:  # Next Fit
-            result = allocator.allocate_next_fit(25)
+        result = allocate(25)
 
         # Analyze free list
-        current = allocator.free_list
-        total_free = 0
-        largest_block = 0
-        block_count = 0
-
-        while current:
-            total_free += current.size
-            if current.size > largest_block:
-                largest_block = current.size
-            block_count += 1
-            current = current.next
+        total_free = sum(allocator.sizes)
+        largest_block = max(allocator.sizes, default=0)
+        block_count = len(allocator.sizes)
 
         if result is not None:
             print(f"   ✅ SUCCESS: Allocated at address {result}")
@@ -471,8 +823,15 @@ def experiment2_fragmentation_test():
         print(f"   • Total free memory: {total_free} units")
         print(f"   • Largest contiguous block: {largest_block} units")
 
+        if algo_name == 'Buddy':
+            print(f"   • Lost to power-of-two rounding: {allocator.rounding_waste} units")
+
         if success:
             print(f"   • Reason: Found block ≥ 25 units ({largest_block})")
+        elif algo_name == 'Buddy':
+            print(f"   • Reason: 25 rounds up to a 32-unit block, and free blocks")
+            print(f"     only merge with their own buddy")
+            print(f"     (Total free: {total_free} in blocks {allocator.sizes}, none ≥ 32)")
         else:
             print(f"   • Reason: External fragmentation")
             print(f"     (Total free: {total_free}, but no block ≥ 25)")
@@ -507,6 +866,12 @@ def experiment2_fragmentation_test():
     print("   • Depends on roving pointer position")
     print("   • May succeed or fail based on fragmentation distribution")
 
+    print("\n4. BUDDY can fail even with plenty of free memory")
+    print("   • Every request is rounded up to a power of two (25 needs 32),")
+    print("     and the rounding is wasted inside the allocated blocks")
+    print("   • A free block only merges with its buddy, so equal-sized free")
+    print("     neighbours that are not buddies stay separate")
+
 
 # ==================== EXPERIMENT 3: SPEED TEST ====================
 def experiment3_speed_test():
@@ -522,45 +887,52 @@ def experiment3_speed_test():
     print("\n" + "-" * 70)
 
     random.seed(123)  # For reproducible results
-    algorithms = ['Best Fit', 'Worst Fit', 'Next Fit']
+    # Draw the whole random workload up front so the timed loop measures
+    # only the allocator, and every algorithm sees the same workload
+    alloc_sizes = [random.randint(1, 10) for _ in range(200)]
+    free_coins = [random.random() < 0.5 for _ in range(200)]
+    free_picks = [random.random() for _ in range(200)]
+
+    algorithms = ['Best Fit', 'Worst Fit', 'Next Fit', 'Segregated Fit', 'Buddy', 'Bitmap']
     results = {}
 
     for algo_name in algorithms:
         print(f"\nTesting {algo_name}...")
 
-        allocator = MemoryAllocator(100)
+        allocator, allocate = create_allocator(algo_name, 100)
         allocated_blocks = []  # Track block IDs for freeing
         allocations_made = 0
         frees_made = 0
 
-        # Start timing
-        start_time = time.perf_counter()
+        # Start timing, with the garbage collector paused so a collection
+        # cannot land inside the measured region
+        gc.collect()
+        gc.disable()
+        try:
+            start_time = time.perf_counter()
 
-        for i in range(200):
-            # Allocate random block
-            size = random.randint(1, 10)
-            block_id = allocator.block_id_counter
+            for i in range(200):
+                # Allocate random block
+                size = alloc_sizes[i]
+                block_id = allocator.block_id_counter
 
-            if algo_name == 'Best Fit':
-                result = allocator.allocate_best_fit(size, block_id)
-            elif algo_name == 'Worst Fit':
-                result = allocator.allocate_worst_fit(size, block_id)
-            else:  # Next Fit
-                result = allocator.allocate_next_fit(size, block_id)
+                result = allocate(size, block_id)
 
-            if result is not None:
-                allocated_blocks.append(block_id)
-                allocations_made += 1
-
-            # Free a block if we have any allocated (with 50% probability)
-            if allocated_blocks and random.random() < 0.5:
-                block_to_free = random.choice(allocated_blocks)
-                allocator.free_block(block_to_free)
-                allocated_blocks.remove(block_to_free)
-                frees_made += 1
-
-        # End timing
-        end_time = time.perf_counter()
+                if result is not None:
+                    allocated_blocks.append(block_id)
+                    allocations_made += 1
+
+                # Free a block if we have any allocated (with 50% probability)
+                if allocated_blocks and free_coins[i]:
+                    block_to_free = allocated_blocks[int(free_picks[i] * len(allocated_blocks))]
+                    allocator.free_block(block_to_free)
+                    allocated_blocks.remove(block_to_free)
+                    frees_made += 1
+
+            # End timing
+            end_time = time.perf_counter()
+        finally:
+            gc.enable()
         elapsed = end_time - start_time
 
         results[algo_name] = {
@@ -590,26 +962,31 @@ def experiment3_speed_test():
             marker = " (FASTEST)"
         elif algo_name == slowest_algo:
             marker = " (SLOWEST)"
-        print(f"  {algo_name:10s}: {time_val:.6f}s ({ops_sec:.0f} ops/sec){marker}")
+        print(f"  {algo_name:14s}: {time_val:.6f}s ({ops_sec:.0f} ops/sec){marker}")
 
     print("\n" + "=" * 70)
     print("PERFORMANCE ANALYSIS")
     print("=" * 70)
 
-    print("\n1. WHY NEXT FIT IS FASTEST:")
-    print("   • Search Strategy: Starts from last position, not beginning")
-    print("   • Average Search Length: ~50% of free list")
-    print("   • Time Complexity: O(n/2) on average")
+    print(f"\nIn this run {fastest_algo} was fastest and {slowest_algo} was slowest.")
+    print("Runs this short are noisy: close entries can swap places between runs.")
+
+    print("\n1. LINEAR SCANS (BEST, WORST AND NEXT FIT):")
+    print("   • Best/Worst Fit: Scan the ENTIRE free list, but as C-level reductions")
+    print("   • Next Fit: Starts from last position and stops at the first fit")
+    print("   • On a 100-unit arena the free list stays short, so all three stay close")
 
-    print("\n2. WHY BEST FIT IS SLOWEST:")
-    print("   • Search Strategy: Must scan ENTIRE free list every time")
-    print("   • Comparison: Compares all blocks to find smallest fit")
-    print("   • Time Complexity: O(n) always")
+    print("\n2. SEGREGATED FIT:")
+    print("   • Search Strategy: Only scans the request's own size class")
+    print("   • Cost: Every split and free relinks nodes and updates two dicts")
+    print("   • On a 100-unit arena that overhead outweighs the scan it saves,")
+    print("     so it ranks near the bottom; it only pays off on long free lists")
 
-    print("\n3. WORST FIT PERFORMANCE:")
-    print("   • Similar to Best Fit: Scans entire list")
-    print("   • Slightly faster: Can stop early in some implementations")
-    print("   • Still O(n) complexity")
+    print("\n3. BUDDY AND BITMAP:")
+    print("   • Buddy: A few list operations per order, no scanning at all")
+    print("     (usually among the fastest, paid for with rounding waste)")
+    print("   • Bitmap: Shifts and masks over the whole arena in one integer")
+    print("     (cost grows with memory size, not with the number of free blocks)")
 
     print("\nSCANNING ANALYSIS PER ALLOCATION:")
     print("  Algorithm    | Avg. Nodes Scanned | Complexity")
@@ -617,9 +994,14 @@ def experiment3_speed_test():
     print("  Next Fit     | ~n/2               | O(n/2)")
     print("  Best Fit     | n                  | O(n)")
     print("  Worst Fit    | n                  | O(n)")
+    print("  Segregated   | own size class     | O(blocks in that class)")
+    print("  Buddy        | ≤ log2(n) orders   | O(log n)")
+    print("  Bitmap       | whole bitmap       | O(memory / word size)")
 
     print("\nCONCLUSION:")
-    print("• For speed: Next Fit is the clear winner")
+    print("• For speed: Data-structure overhead matters more than the scan on")
+    print("  a small arena; check the ranking above rather than the complexity")
+    print("• For speed with predictable cost: Buddy, at the price of rounding waste")
     print("• For fragmentation: Worst Fit performs better")
     print("• For space utilization: Best Fit is most efficient")
     print("• Real systems often use hybrid approaches")